@@ -0,0 +1,19 @@
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+
+def build(setup_kwargs):
+    # Compiling needs a C compiler, without one the pure Python modules are installed as they are
+    if cythonize is None:
+        return
+    ext_modules = cythonize(
+        ["requests_decorator/requests.py", "requests_decorator/responses.py"],
+        build_dir="build",
+        language_level=3,
+        compiler_directives={"boundscheck": False, "wraparound": False},
+    )
+    for ext_module in ext_modules:
+        ext_module.optional = True
+    setup_kwargs.update(ext_modules=ext_modules)
@@ -1,17 +1,128 @@
+import sys
 import typing
 
-from dataclasses import is_dataclass, asdict
+from dataclasses import fields
+from operator import attrgetter
 
 from requests_decorator.exceptions import SerialisationException
+from requests_decorator.utils import get_list_item_model, is_dataclass_type, is_list_model, normalise_content_type
 
 
 RequestKwargs = dict
 
-_REQUESTS_KWARGS = ["params", "data", "headers", "cookies", "files", "auth", "timeout", "allow_redirects",
-                    "proxies", "hooks", "stream", "verify", "cert", "json"]
+_REQUESTS_KWARGS = ("params", "data", "headers", "cookies", "files", "auth", "timeout", "allow_redirects",
+                    "proxies", "hooks", "stream", "verify", "cert", "json")
+
+_FIELDS_CACHE: typing.Dict[type, typing.Tuple[typing.Tuple[str, ...], typing.Callable[[typing.Any], typing.Any]]] = {}
+
+_SERIALISER_CACHE: typing.Dict[type, typing.Callable[[typing.Any], dict]] = {}
+
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None), bytes, complex, range, slice})
+
+_KIND_ATOMIC = 0
+_KIND_DATACLASS = 1
+_KIND_LIST = 2
+_KIND_OTHER = 3
+
+_KIND_CACHE: typing.Dict[type, int] = {}
+
+
+def _compute_kind(value_type):
+    if value_type in _ATOMIC_TYPES:
+        return _KIND_ATOMIC
+    if is_dataclass_type(value_type):
+        return _KIND_DATACLASS
+    if issubclass(value_type, list):
+        return _KIND_LIST
+    return _KIND_OTHER
+
+
+def _classify(value):
+    value_type = type(value)
+    kind = _KIND_CACHE.get(value_type)
+    if kind is None:
+        kind = _compute_kind(value_type)
+        _KIND_CACHE[value_type] = kind
+    return kind
+
+
+def _get_fields(dataclass_type):
+    # Returns the field names with an attrgetter for them, which returns a tuple unless there is a single field
+    cached_fields = _FIELDS_CACHE.get(dataclass_type)
+    if cached_fields is None:
+        names = tuple(sys.intern(field.name) for field in fields(dataclass_type))
+        getter = attrgetter(*names) if names else lambda obj: ()
+        cached_fields = _FIELDS_CACHE.setdefault(dataclass_type, (names, getter))
+    return cached_fields
+
+
+def _get_field_names(dataclass_type):
+    return _get_fields(dataclass_type)[0]
+
+
+def _shallow_asdict(obj):
+    # Shallow alternative to dataclasses.asdict, avoids deepcopying every field
+    names = _get_field_names(type(obj))
+    serialised = dict()
+    for name in names:
+        value = getattr(obj, name)
+        serialised[name] = value if type(value) in _ATOMIC_TYPES else _serialise_value(value)
+    return serialised
+
+
+def _shallow_asdict_list(objs):
+    serialised = []
+    obj_type = None
+    for obj in objs:
+        if type(obj) is not obj_type:
+            obj_type = type(obj)
+            names, getter = _get_fields(obj_type)
+            is_single_field = len(names) == 1
+        values = (getter(obj),) if is_single_field else getter(obj)
+        serialised.append({
+            name: value if type(value) in _ATOMIC_TYPES else _serialise_value(value)
+            for name, value in zip(names, values)
+        })
+    return serialised
+
+
+def _serialise_value(value):
+    kind = _classify(value)
+    if kind == _KIND_ATOMIC:
+        return value
+    if kind == _KIND_DATACLASS:
+        return _shallow_asdict(value)
+    if kind == _KIND_LIST:
+        return [item if type(item) in _ATOMIC_TYPES else _serialise_value(item) for item in value]
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(*[_serialise_value(item) for item in value])
+    if isinstance(value, tuple):
+        return type(value)(_serialise_value(item) for item in value)
+    if isinstance(value, dict):
+        return type(value)((_serialise_value(key), _serialise_value(item)) for key, item in value.items())
+    return value
+
+
+def _compile_serialiser(dataclass_type):
+    # Generate a serialiser specialised to the dataclass fields, e.g. def _serialise(obj): return {'foo': obj.foo}
+    serialiser = _SERIALISER_CACHE.get(dataclass_type)
+    if serialiser is None:
+        names = _get_field_names(dataclass_type)
+        source = "def _serialise(obj):\n"
+        source += "".join(f"    value_{index} = obj.{name}\n" for index, name in enumerate(names))
+        source += "    return {" + ", ".join(
+            f"{name!r}: value_{index} if type(value_{index}) in _ATOMIC_TYPES else _serialise_value(value_{index})"
+            for index, name in enumerate(names)
+        ) + "}\n"
+        namespace = {"_ATOMIC_TYPES": _ATOMIC_TYPES, "_serialise_value": _serialise_value}
+        exec(source, namespace)
+        serialiser = _SERIALISER_CACHE.setdefault(dataclass_type, namespace["_serialise"])
+    return serialiser
 
 
 class Request:
+    __slots__ = ("_request_model",)
+
     media_type = None
     default_model = str
 
@@ -19,7 +130,7 @@ class Request:
         self._request_model = request_model or self.default_model
 
     def get_requests_kwargs(self, kwargs):
-        requests_kwargs = dict(filter(lambda kv_pair: kv_pair[0] in _REQUESTS_KWARGS, kwargs.items()))
+        requests_kwargs = {key: kwargs[key] for key in _REQUESTS_KWARGS if key in kwargs}
         headers = kwargs.get("headers")
         if headers:
             requests_kwargs["headers"] = self.serialise_headers(headers)
@@ -31,8 +142,9 @@ class Request:
     def serialise_headers(self, headers):
         serialised_headers = dict()
         for key, value in headers.items():
-            if is_dataclass(value):
-                serialised_headers[key] = asdict(value)
+            kind = _classify(value)
+            if kind == _KIND_DATACLASS:
+                serialised_headers[key] = _shallow_asdict(value)
             else:
                 serialised_headers[key] = value
         return serialised_headers
@@ -42,23 +154,33 @@ class Request:
 
 
 class TextRequest(Request):
+    __slots__ = ()
+
     media_type = "text/plain"
 
 
 class JsonRequest(Request):
+    __slots__ = ("_is_request_model", "_is_list_request_model", "_serialise_impl")
+
     media_type = "application/json"
     default_model = dict
 
     def __init__(self, request_model=None):
         self._is_request_model = request_model is not None
-        self._is_list_request_model = typing.get_origin(request_model) is list
+        self._is_list_request_model = is_list_model(request_model)
         super().__init__(
-            request_model=request_model if not self._is_list_request_model else typing.get_args(request_model)[0]
+            request_model=get_list_item_model(request_model) if self._is_list_request_model else request_model
         )
+        self._serialise_impl = \
+            _compile_serialiser(self._request_model) if is_dataclass_type(self._request_model) else _shallow_asdict
 
     def serialise_data(self, data):
         is_list_object = isinstance(data, list)
-        if self._is_request_model and type(self._request_model) != type(data):
+        if self._is_request_model:
+            if not is_dataclass_type(self._request_model):
+                raise SerialisationException(
+                    "Unable to serialise request. 'request_model' must be a dataclass."
+                )
             if is_list_object and not self._is_list_request_model:
                 raise SerialisationException(
                     "Unable to serialise request. Request is a list but 'request_model' defined is not."
@@ -67,12 +189,16 @@ class JsonRequest(Request):
                 raise SerialisationException(
                     "Unable to serialise request. 'request_model' defined a list but request was not a list."
                 )
-            raise SerialisationException(
-                "Unable to serialise request. Request data type does not match type defined by 'request_model'."
-            )
+            data_items = data if is_list_object else (data,)
+            if any(type(data_item) is not self._request_model for data_item in data_items):
+                raise SerialisationException(
+                    "Unable to serialise request. Request data type does not match type defined by 'request_model'."
+                )
+        if is_list_object and self._is_request_model:
+            return [self._serialise_impl(data_item) for data_item in data]
         if is_list_object:
-            return [asdict(data_item) for data_item in data]
-        return asdict(data)
+            return _shallow_asdict_list(data)
+        return self._serialise_impl(data)
 
 
 REQUEST_DECORATORS = [
@@ -81,15 +207,19 @@ REQUEST_DECORATORS = [
     JsonRequest
 ]
 
+_CONTENT_TYPE_MAP = {request_decorator.media_type: request_decorator for request_decorator in REQUEST_DECORATORS}
+
+_MISSING = object()
+
 
 def get_request(headers, request_model=None, request_class: typing.Type[Request] = None) -> Request:
     if request_class:
         return request_class(request_model=request_model)
     else:
-        content_type = headers.get('content-type', None)
-        for request_decorator in REQUEST_DECORATORS:
-            if content_type == request_decorator.media_type:
-                return request_decorator(request_model=request_model)
-        raise SerialisationException(
-            f"Unable to provide request serialiser. Request content-type {content_type} is not supported."
-        )
+        content_type = normalise_content_type(headers.get('content-type', None))
+        request_decorator = _CONTENT_TYPE_MAP.get(content_type, _MISSING)
+        if request_decorator is _MISSING:
+            raise SerialisationException(
+                f"Unable to provide request serialiser. Request content-type {content_type} is not supported."
+            )
+        return request_decorator(request_model=request_model)
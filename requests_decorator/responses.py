@@ -1,11 +1,49 @@
+import codecs
+import json
+import re
 import typing
-from dataclasses import is_dataclass
+from functools import lru_cache
 from typing import Type
 
 import pydantic
 import requests
 
 from requests_decorator.exceptions import SerialisationException
+from requests_decorator.utils import get_list_item_model, is_list_model, normalise_content_type
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_LONG_DIGITS = re.compile(rb"\d{19,}")
+
+
+def _loads(content):
+    # orjson turns integers outside 64 bits into floats and only accepts UTF-8, anything it may get wrong uses json
+    if orjson is not None and not _LONG_DIGITS.search(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+@lru_cache(maxsize=None)
+def _is_utf_encoding(encoding):
+    if encoding is None:
+        return True
+    try:
+        return codecs.lookup(encoding).name.startswith("utf")
+    except LookupError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def _get_parsing_model(model):
+    # Root model holding the compiled validators for 'model', the pydantic 1.x equivalent of a TypeAdapter
+    return pydantic.create_model(f"Parsing{getattr(model, '__name__', 'Model')}", __root__=(model, ...))
 
 
 class Response(requests.Response):
@@ -32,20 +70,37 @@ class JsonResponse(Response):
     default_model = dict
 
     def __init__(self, response: requests.Response, response_model=None):
-        is_list_response_model = typing.get_origin(response_model) is list
+        is_list_response_model = is_list_model(response_model)
         super().__init__(
             response,
-            response_model=response_model if not is_list_response_model else typing.get_args(response_model)[0]
+            response_model=get_list_item_model(response_model) if is_list_response_model else response_model
         )
         self._is_response_model = response_model is not None
         self._is_list_response_model = is_list_response_model
-        if is_dataclass(self._response_model):
-            # Decorate std dataclass with pydantic dataclass
+        if pydantic.dataclasses.is_builtin_dataclass(self._response_model):
+            # Decorate std dataclass with pydantic dataclass, this patches the std dataclass in place so only runs once
             pydantic.dataclasses.dataclass(self._response_model)
+        self._parsing_model = None
+        if self._is_response_model:
+            self._parsing_model = _get_parsing_model(
+                typing.List[self._response_model] if self._is_list_response_model else self._response_model
+            )
+
+    def _load_content(self):
+        if _is_utf_encoding(self.encoding):
+            try:
+                return _loads(self.content or b"")
+            except UnicodeDecodeError:
+                pass
+        # Decode with the declared or detected charset, as requests.Response.json() does
+        return json.loads(self.text)
 
     def deserialise_content(self):
-        json_body = self.json()
-        is_list_json_body = isinstance(json_body, list)
+        try:
+            json_body = self._load_content()
+        except json.JSONDecodeError as error:
+            raise requests.exceptions.JSONDecodeError(error.msg, error.doc, error.pos)
+        is_list_json_body = type(json_body) is list
         if self._is_response_model and is_list_json_body != self._is_list_response_model:
             if is_list_json_body and not self._is_list_response_model:
                 raise SerialisationException(
@@ -54,9 +109,9 @@ class JsonResponse(Response):
             raise SerialisationException(
                 "Unable to deserialise response. 'response_model' defined a list but response was not a list."
             )
-        if is_list_json_body:
-            return [self._response_model(**json_item) for json_item in json_body]
-        return self._response_model(**json_body)
+        if not self._is_response_model:
+            return json_body
+        return self._parsing_model.parse_obj(json_body).__root__
 
 
 RESPONSE_DECORATORS = [
@@ -65,15 +120,22 @@ RESPONSE_DECORATORS = [
     JsonResponse
 ]
 
+_CONTENT_TYPE_MAP = {response_decorator.media_type: response_decorator for response_decorator in RESPONSE_DECORATORS}
+
+_MISSING = object()
+
 
 def decorate_response(response: requests.Response, response_model, response_class: Type[Response] = None) -> Response:
     if response_class:
         return response_class(response, response_model=response_model)
     else:
-        content_type = response.headers.get('content-type', None)
-        for response_decorator in RESPONSE_DECORATORS:
-            if content_type == response_decorator.media_type:
-                return response_decorator(response, response_model=response_model)
-        raise SerialisationException(
-            f"Unable to provide response serialiser. Response content-type '{content_type}' is not supported."
-        )
+        content_type = getattr(response, "_decorated_content_type", _MISSING)
+        if content_type is _MISSING:
+            content_type = normalise_content_type(response.headers.get('content-type', None))
+            response._decorated_content_type = content_type
+        response_decorator = _CONTENT_TYPE_MAP.get(content_type, _MISSING)
+        if response_decorator is _MISSING:
+            raise SerialisationException(
+                f"Unable to provide response serialiser. Response content-type '{content_type}' is not supported."
+            )
+        return response_decorator(response, response_model=response_model)
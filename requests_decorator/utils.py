@@ -1,4 +1,7 @@
+import typing
 from copy import deepcopy
+from dataclasses import is_dataclass
+from functools import lru_cache
 
 
 def deep_concat(original_dict, override_dict):
@@ -11,3 +14,24 @@ def deep_concat(original_dict, override_dict):
         else:
             new_dict[key] = override_value
     return new_dict
+
+
+@lru_cache(maxsize=None)
+def is_dataclass_type(model):
+    return is_dataclass(model)
+
+
+@lru_cache(maxsize=None)
+def is_list_model(model):
+    return typing.get_origin(model) is list
+
+
+@lru_cache(maxsize=None)
+def get_list_item_model(model):
+    return typing.get_args(model)[0]
+
+
+@lru_cache(maxsize=None)
+def normalise_content_type(content_type):
+    # Drop media type parameters such as charset, e.g. 'application/json; charset=utf-8'
+    return content_type.split(";", 1)[0].strip().lower() if content_type else None
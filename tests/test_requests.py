@@ -4,7 +4,7 @@ import pydantic.dataclasses
 import pytest
 
 from requests_decorator.exceptions import SerialisationException
-from requests_decorator.requests import Request, RequestKwargs, TextRequest, JsonRequest
+from requests_decorator.requests import Request, RequestKwargs, TextRequest, JsonRequest, get_request
 
 
 @dataclasses.dataclass
@@ -17,6 +17,17 @@ class TestPydanticDataclass:
     foo: str
 
 
+@dataclasses.dataclass
+class TestNestedDataclass:
+    foo: TestStdDataclass
+
+
+@dataclasses.dataclass
+class TestContainerDataclass:
+    foo: list
+    bar: dict
+
+
 class TestRequest:
 
     def setup_method(self):
@@ -42,6 +53,17 @@ class TestRequest:
         assert result
         assert result == {"example": {"foo": "bar"}}
 
+    def test_serialise_headers_when_headers_are_mixed_return_serialised_headers_in_order(self):
+        headers = {
+            "first": TestStdDataclass(foo="bar"),
+            "second": "example",
+            "third": TestPydanticDataclass(foo="baz"),
+            "fourth": TestStdDataclass(foo="qux"),
+        }
+        result = self._request.serialise_headers(headers)
+        assert result == {"first": {"foo": "bar"}, "second": "example", "third": {"foo": "baz"}, "fourth": {"foo": "qux"}}
+        assert list(result) == ["first", "second", "third", "fourth"]
+
     def test_request_get_requests_kwargs_when_no_kwargs_return_empty_dict(self):
         kwargs = RequestKwargs()
         request_kwargs = self._request.get_requests_kwargs(kwargs)
@@ -51,6 +73,10 @@ class TestRequest:
     def test_media_type_is_none(self):
         assert self._request.media_type is None
 
+    def test_serialise_data_when_list_request_model_then_returns_initialised_request_model(self):
+        result = Request(request_model=list[str]).serialise_data("ab")
+        assert result == ["a", "b"]
+
     def test_default_data_model_is_str(self):
         assert self._request.default_model is str
 
@@ -88,12 +114,44 @@ class TestJsonRequest:
         assert result
         assert result == {"foo": "bar"}
 
+    def test_serialise_data_when_data_is_nested_dataclass_return_serialised_data(self):
+        data = TestNestedDataclass(foo=TestStdDataclass(foo="bar"))
+        result = self._request.serialise_data(data)
+        assert result
+        assert result == {"foo": {"foo": "bar"}}
+
+    def test_serialise_data_when_data_has_container_fields_return_serialised_data(self):
+        data = TestContainerDataclass(foo=[TestStdDataclass(foo="bar"), 0], bar={"baz": TestStdDataclass(foo="qux")})
+        result = self._request.serialise_data(data)
+        assert result
+        assert result == {"foo": [{"foo": "bar"}, 0], "bar": {"baz": {"foo": "qux"}}}
+
     def test_serialise_data_when_data_is_list_of_dataclass_return_serialised_data(self):
         data = [TestPydanticDataclass(foo="bar"), TestPydanticDataclass(foo="baz")]
         result = self._request.serialise_data(data)
         assert result
         assert result == [{"foo": "bar"}, {"foo": "baz"}]
 
+    def test_serialise_data_when_data_matches_model_return_serialised_data(self):
+        data = TestPydanticDataclass(foo="bar")
+        result = JsonRequest(request_model=TestPydanticDataclass).serialise_data(data)
+        assert result == {"foo": "bar"}
+
+    def test_serialise_data_when_data_matches_list_model_return_serialised_data(self):
+        data = [TestPydanticDataclass(foo="bar"), TestPydanticDataclass(foo="baz")]
+        result = JsonRequest(request_model=list[TestPydanticDataclass]).serialise_data(data)
+        assert result == [{"foo": "bar"}, {"foo": "baz"}]
+
+    def test_serialise_data_when_data_with_container_fields_matches_model_return_serialised_data(self):
+        data = TestContainerDataclass(foo=[TestStdDataclass(foo="bar")], bar={"baz": 0})
+        result = JsonRequest(request_model=TestContainerDataclass).serialise_data(data)
+        assert result == {"foo": [{"foo": "bar"}], "bar": {"baz": 0}}
+
+    def test_serialise_data_when_data_is_list_of_mixed_dataclasses_return_serialised_data(self):
+        data = [TestContainerDataclass(foo=[TestStdDataclass(foo="bar")], bar={}), TestStdDataclass(foo="baz")]
+        result = self._request.serialise_data(data)
+        assert result == [{"foo": [{"foo": "bar"}], "bar": {}}, {"foo": "baz"}]
+
     def test_serialise_data_when_data_is_list_and_model_not_then_raise_error(self):
         data = [TestPydanticDataclass(foo="bar")]
         with pytest.raises(Exception) as error:
@@ -112,6 +170,13 @@ class TestJsonRequest:
         assert error.value.args[0] == \
                "Unable to serialise request. 'request_model' defined a list but request was not a list."
 
+    def test_serialise_data_when_model_is_not_dataclass_then_raise_error(self):
+        with pytest.raises(Exception) as error:
+            JsonRequest(request_model=dict).serialise_data({"foo": "bar"})
+        assert error
+        assert error.type == SerialisationException
+        assert error.value.args[0] == "Unable to serialise request. 'request_model' must be a dataclass."
+
     def test_serialise_data_when_data_and_model_type_dont_match_then_raise_error(self):
         data = TestPydanticDataclass(foo="bar")
         with pytest.raises(Exception) as error:
@@ -120,3 +185,32 @@ class TestJsonRequest:
         assert error.type == SerialisationException
         assert error.value.args[0] == \
                "Unable to serialise request. Request data type does not match type defined by 'request_model'."
+
+
+def test_get_request_when_request_class_then_return_request_class_instance():
+    result = get_request({}, request_class=TextRequest)
+    assert isinstance(result, TextRequest)
+
+
+def test_get_request_when_content_type_is_none_then_return_request_instance():
+    result = get_request({})
+    assert type(result) is Request
+
+
+def test_get_request_when_content_type_is_json_then_return_json_request_instance():
+    result = get_request({"content-type": "application/json"})
+    assert isinstance(result, JsonRequest)
+
+
+def test_get_request_when_content_type_has_parameters_then_return_json_request_instance():
+    result = get_request({"content-type": "Application/JSON; charset=utf-8"})
+    assert isinstance(result, JsonRequest)
+
+
+def test_get_request_when_content_type_is_not_recognised_then_raise_error():
+    with pytest.raises(Exception) as error:
+        get_request({"content-type": "foobar"})
+    assert error
+    assert error.type == SerialisationException
+    assert error.value.args[0] == \
+           "Unable to provide request serialiser. Request content-type foobar is not supported."
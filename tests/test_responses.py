@@ -1,4 +1,5 @@
 import dataclasses
+from unittest import mock
 
 import pydantic
 import pytest
@@ -46,6 +47,12 @@ class TestResponse:
         result = response.deserialise_content()
         assert isinstance(result, TestResponse.TestModel)
 
+    def test_deserialise_content_when_list_response_model_then_returns_initialised_response_model(self):
+        self._response._content = b"ab"
+        response = Response(self._response, response_model=list[int])
+        result = response.deserialise_content()
+        assert result == [97, 98]
+
     def test_deserialise_content_when_no_response_model_then_returns_initialised_default_response_model(self):
         response = Response(self._response)
         result = response.deserialise_content()
@@ -84,6 +91,16 @@ class TestJsonResponse:
         assert dataclasses.is_dataclass(result._response_model)
         assert not pydantic.dataclasses.is_builtin_dataclass(result._response_model)
 
+    def test_response_when_initialised_twice_with_std_dataclass_response_model_then_converts_once(self):
+        @dataclasses.dataclass
+        class TestModel:
+            foo: str
+
+        with mock.patch("pydantic.dataclasses.dataclass", wraps=pydantic.dataclasses.dataclass) as converter:
+            JsonResponse(self._response, response_model=TestModel)
+            JsonResponse(requests.Response(), response_model=TestModel)
+        converter.assert_called_once_with(TestModel)
+
     def test_deserialise_content_when_response_model_then_returns_initialised_response_model(self):
         self._response._content = str.encode('{"foo": "moo", "bar": 0}')
         response = JsonResponse(self._response, response_model=TestPydanticDataclass)
@@ -92,6 +109,14 @@ class TestJsonResponse:
         assert result.foo == "moo"
         assert result.bar == 0
 
+    def test_deserialise_content_when_std_dataclass_response_model_then_returns_initialised_response_model(self):
+        self._response._content = str.encode('{"foo": "moo", "bar": 0}')
+        response = JsonResponse(self._response, response_model=TestStdDataclass)
+        result = response.deserialise_content()
+        assert isinstance(result, TestStdDataclass)
+        assert result.foo == "moo"
+        assert result.bar == 0
+
     def test_deserialise_content_when_no_response_model_then_returns_initialised_default_response_model(self):
         self._response._content = str.encode('{"foo": "moo", "bar": 0}')
         response = JsonResponse(self._response)
@@ -100,6 +125,52 @@ class TestJsonResponse:
         assert result["foo"] == "moo"
         assert result["bar"] == 0
 
+    def test_deserialise_content_when_no_response_model_and_content_is_list_then_returns_content(self):
+        self._response._content = str.encode('[{"foo": "moo", "bar": 0}, {"foo": "baz", "bar": 1, "fizz": 2}]')
+        response = JsonResponse(self._response)
+        result = response.deserialise_content()
+        assert result == [{"foo": "moo", "bar": 0}, {"foo": "baz", "bar": 1, "fizz": 2}]
+
+    def test_deserialise_content_when_no_response_model_and_content_has_root_key_then_returns_content(self):
+        self._response._content = str.encode('{"__root__": 5}')
+        response = JsonResponse(self._response)
+        result = response.deserialise_content()
+        assert result == {"__root__": 5}
+
+    def test_deserialise_content_when_content_is_not_valid_json_then_raise_error(self):
+        self._response._content = str.encode('{"foo": ')
+        response = JsonResponse(self._response)
+        with pytest.raises(Exception) as error:
+            response.deserialise_content()
+        assert error
+        assert error.type == requests.exceptions.JSONDecodeError
+        assert isinstance(error.value, requests.RequestException)
+
+    def test_deserialise_content_when_content_is_latin1_then_returns_decoded_content(self):
+        self._response._content = '{"name": "café"}'.encode("latin-1")
+        self._response.encoding = "ISO-8859-1"
+        response = JsonResponse(self._response)
+        result = response.deserialise_content()
+        assert result == {"name": "café"}
+
+    def test_deserialise_content_when_content_is_latin1_without_encoding_then_matches_requests_json(self):
+        self._response._content = '{"name": "café"}'.encode("latin-1")
+        response = JsonResponse(self._response)
+        result = response.deserialise_content()
+        assert result == self._response.json()
+
+    def test_deserialise_content_when_content_has_large_integer_then_returns_integer(self):
+        self._response._content = str.encode('{"foo": 123456789012345678901234567890, "bar": -9223372036854775809}')
+        response = JsonResponse(self._response)
+        result = response.deserialise_content()
+        assert result == {"foo": 123456789012345678901234567890, "bar": -9223372036854775809}
+
+    def test_deserialise_content_when_content_is_utf16_or_nan_then_returns_content(self):
+        self._response._content = '{"foo": NaN}'.encode("utf-16")
+        response = JsonResponse(self._response)
+        result = response.deserialise_content()
+        assert result["foo"] != result["foo"]
+
     def test_deserialise_content_when_response_model_and_content_is_list_then_returns_initialised_response_model_list(self):
         self._response._content = str.encode('[{"foo": "moo", "bar": 0}, {"foo": "baz", "bar": 1}]')
         response = JsonResponse(self._response, response_model=list[TestPydanticDataclass])
@@ -157,6 +228,22 @@ def test_decorate_response_when_content_type_is_json_then_return_json_response_i
     assert isinstance(result, JsonResponse)
 
 
+def test_decorate_response_when_content_type_has_parameters_then_return_json_response_instance():
+    response = requests.Response()
+    response.headers["content-type"] = "Application/JSON; charset=utf-8"
+    result = decorate_response(response, dict)
+    assert isinstance(result, JsonResponse)
+
+
+def test_decorate_response_when_decorated_twice_then_uses_cached_content_type():
+    response = requests.Response()
+    response.headers["content-type"] = "application/json"
+    decorate_response(response, dict)
+    response.headers["content-type"] = "foobar"
+    result = decorate_response(response, dict)
+    assert isinstance(result, JsonResponse)
+
+
 def test_decorate_response_when_content_type_is_not_recognised_then_raise_error():
     response = requests.Response()
     response.headers["content-type"] = "foobar"